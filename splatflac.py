@@ -2,28 +2,26 @@
 """
 Split FLAC or WAV audio tracks into files, using a CUE sheet.
 WAV inputs are re-encoded to FLAC with compression level 8.
-FLAC inputs are re-encoded by default to fix STREAMINFO; use --streamcopy
-to keep original FLAC frames.
+FLAC inputs keep their original frames and get a recomputed STREAMINFO
+(sample count and MD5); use --reencode for sample-accurate cuts, or
+--streamcopy to skip the STREAMINFO fix.
 This script does not adjust for zero-crossings or apply fades.
 """
 
 from __future__ import annotations
 
-import argparse
+import hashlib
+import os
 import re
 import shutil
 import subprocess
 import sys
 import time
 from dataclasses import dataclass, field
-from decimal import Decimal, ROUND_HALF_UP, getcontext
-from fractions import Fraction
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-getcontext().prec = 18
-
-__version__ = "0.0.2"
+__version__ = "0.0.3"
 BANNER = f"splat v{__version__}"
 
 class Style:
@@ -60,7 +58,7 @@ class Track:
     number: int
     title: Optional[str] = None
     performer: Optional[str] = None
-    start: Optional[Fraction] = None
+    start_frames: Optional[int] = None
 
 
 @dataclass
@@ -76,29 +74,67 @@ class CueSheet:
     album_performer: Optional[str] = None
 
 
+@dataclass
+class StreamInfo:
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    total_samples: int
+    md5: bytes
+
+
+@dataclass
+class Segment:
+    output_path: Path
+    start_frames: int
+    end_frames: Optional[int]
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+FRAMES_PER_SECOND = 75
+# ffmpeg never reads the terminal here; -nostdin stops it polling for keys.
+FFMPEG_BASE = ("-hide_banner", "-nostdin", "-loglevel", "error")
+# close_fds=False keeps CPython on its posix_spawn fast path (our own fds are
+# non-inheritable). Windows has no such path, and there it would let ffmpeg
+# inherit another thread's pipe handles, so keep the default.
+CLOSE_FDS = os.name != "posix"
+# STREAMINFO is the mandatory first metadata block, right after the fLaC magic.
+STREAMINFO_OFFSET = 8
+STREAMINFO_LENGTH = 34
+TOTAL_SAMPLES_MASK = (1 << 36) - 1
+# Raw PCM layouts matching the bytes FLAC feeds into its STREAMINFO MD5.
+FLAC_PCM_FORMATS = {8: "s8", 16: "s16le", 24: "s24le", 32: "s32le"}
+
 TIME_RE = re.compile(r"^(\d+):(\d{2}):(\d{2})$")
-FILE_RE = re.compile(r'^\s*FILE\s+(?:"([^"]+)"|(\S+))\s+\S+', re.IGNORECASE)
-WINDOWS_RESERVED_RE = re.compile(r'[<>:"/\\\\|?*]')
+WINDOWS_RESERVED_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
 
 
 def sanitize_filename(value: str) -> str:
     """Replace path separators and reserved characters with underscores."""
-    cleaned = WINDOWS_RESERVED_RE.sub("_", value)
+    cleaned = value.translate(WINDOWS_RESERVED_TABLE)
     cleaned = cleaned.replace("..", "__").strip()
     return cleaned or "untitled"
 
 
-def parse_file_line(line: str, line_num: int) -> str:
+def parse_file_line(rest: str, line_num: int) -> str:
     """Extract the FILE path without interpreting backslash escapes."""
-    match = FILE_RE.match(line)
-    if not match:
-        raise ValueError(f"Line {line_num}: malformed FILE entry")
-    return match.group(1) or match.group(2) or ""
+    # rest is the text after FILE: a quoted or bare name followed by a file type.
+    rest = rest.lstrip()
+    if rest.startswith('"'):
+        end = rest.find('"', 1)
+        tail = rest[end + 1:]
+        if end > 1 and tail[:1].isspace() and tail.strip():
+            return rest[1:end]
+    else:
+        parts = rest.split(None, 1)
+        if len(parts) == 2:
+            return parts[0]
+    raise ValueError(f"Line {line_num}: malformed FILE entry")
 
 
-def parse_timecode(value: str, line_num: int) -> Fraction:
-    """Convert mm:ss:ff (75 fps) into fractional seconds."""
-    # Validate and convert mm:ss:ff (75 frames/second) into fractional seconds.
+def parse_timecode(value: str, line_num: int) -> int:
+    """Convert mm:ss:ff (75 fps) into a count of CUE frames."""
+    # Validate and convert mm:ss:ff (75 frames/second) into whole frames.
     match = TIME_RE.match(value)
     if not match:
         raise ValueError(f"Line {line_num}: invalid timecode '{value}'")
@@ -109,7 +145,7 @@ def parse_timecode(value: str, line_num: int) -> Fraction:
         raise ValueError(f"Line {line_num}: seconds out of range in '{value}'")
     if frames >= 75:
         raise ValueError(f"Line {line_num}: frames out of range in '{value}'")
-    return Fraction(minutes * 60 + seconds, 1) + Fraction(frames, 75)
+    return minutes * 60 * FRAMES_PER_SECOND + seconds * FRAMES_PER_SECOND + frames
 
 
 def parse_cue_value(value: str, line_num: int, keyword: str) -> str:
@@ -124,109 +160,151 @@ def parse_cue_value(value: str, line_num: int, keyword: str) -> str:
     return value
 
 
-def split_cue_line(line: str, line_num: int) -> List[str]:
-    """Split a CUE line on whitespace without shell-style parsing."""
-    tokens = line.split()
-    if not tokens:
-        raise ValueError(f"Line {line_num}: malformed CUE entry")
-    return tokens
-
-
-def fraction_to_timestamp(value: Fraction) -> str:
-    """Format fractional seconds for ffmpeg timestamps with microsecond precision."""
-    # Format fractional seconds as a fixed-precision string for ffmpeg.
-    seconds = Decimal(value.numerator) / Decimal(value.denominator)
-    return str(seconds.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP))
+def frames_to_timestamp(frames: int) -> str:
+    """Format CUE frames as seconds for ffmpeg timestamps with microsecond precision."""
+    # Round half up to whole microseconds using integer arithmetic only.
+    micros = (frames * 2_000_000 + FRAMES_PER_SECOND) // (2 * FRAMES_PER_SECOND)
+    return f"{micros // 1_000_000}.{micros % 1_000_000:06d}"
 
 
 def read_cue_text(cue_path: Path) -> str:
-    """Read CUE text, preferring UTF-8 with a cp1252 fallback."""
-    # Try UTF-8 first, then fall back to Windows-1252 for common CUE exports.
+    """Read CUE text once, honouring a BOM, else UTF-8 with a cp1252 fallback."""
+    # Sniff the BOM first, then try UTF-8 and fall back to Windows-1252 for
+    # common CUE exports, decoding the bytes already in memory.
+    raw = cue_path.read_bytes()
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return raw[3:].decode("utf-8")
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return raw.decode("utf-16")
     try:
-        return cue_path.read_text(encoding="utf-8")
+        return raw.decode("utf-8")
     except UnicodeDecodeError:
-        return cue_path.read_text(encoding="cp1252")
+        return raw.decode("cp1252")
 
 
-def parse_cue(cue_path: Path) -> CueSheet:
-    """Parse the CUE into ordered file/track entries with INDEX 01 boundaries."""
-    # Parse the CUE, grouping tracks under their referenced FILE entries.
-    file_entries: List[FileEntry] = []
+@dataclass
+class _ParseState:
+    base_dir: Path
+    entries: List[FileEntry] = field(default_factory=list)
     current_file: Optional[FileEntry] = None
     current_track: Optional[Track] = None
     album_title: Optional[str] = None
     album_performer: Optional[str] = None
+    file_names: Optional[set[str]] = None
+
+
+def _list_file_names(directory: Path) -> set[str]:
+    """Return the names of regular files in a directory from a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _handle_file(rest: str, line_num: int, state: _ParseState) -> None:
+    # Each FILE starts a new input and resets the current track context.
+    file_name = parse_file_line(rest, line_num)
+    file_path = state.base_dir / file_name
+    # One directory listing answers most FILE lookups; isfile() covers the rest
+    # (subdirectories, case-insensitive filesystems, unreadable directories).
+    if state.file_names is None:
+        state.file_names = _list_file_names(state.base_dir)
+    if file_name not in state.file_names and not os.path.isfile(file_path):
+        raise FileNotFoundError(f"Line {line_num}: missing file '{file_path}'")
+    state.current_file = FileEntry(path=file_path)
+    state.entries.append(state.current_file)
+    state.current_track = None
+
+
+def _handle_track(rest: str, line_num: int, state: _ParseState) -> None:
+    # Track definitions belong to the most recent FILE entry.
+    if state.current_file is None:
+        raise ValueError(f"Line {line_num}: TRACK before FILE")
+    tokens = rest.split()
+    if not tokens:
+        raise ValueError(f"Line {line_num}: malformed TRACK entry")
+    try:
+        track_number = int(tokens[0])
+    except ValueError as exc:
+        raise ValueError(f"Line {line_num}: invalid TRACK number") from exc
+    state.current_track = Track(number=track_number)
+    state.current_file.tracks.append(state.current_track)
+
+
+def _handle_title(rest: str, line_num: int, state: _ParseState) -> None:
+    # Only track-level TITLE entries are needed for output naming.
+    title = parse_cue_value(rest, line_num, "TITLE")
+    if state.current_track is None:
+        if state.album_title is None:
+            state.album_title = title
+    else:
+        state.current_track.title = title
+
+
+def _handle_performer(rest: str, line_num: int, state: _ParseState) -> None:
+    performer = parse_cue_value(rest, line_num, "PERFORMER")
+    if state.current_track is None:
+        if state.album_performer is None:
+            state.album_performer = performer
+    else:
+        state.current_track.performer = performer
+
+
+def _handle_index(rest: str, line_num: int, state: _ParseState) -> None:
+    # Only INDEX 01 defines track boundaries.
+    if state.current_track is None:
+        raise ValueError(f"Line {line_num}: INDEX before TRACK")
+    tokens = rest.split()
+    if len(tokens) < 2:
+        raise ValueError(f"Line {line_num}: malformed INDEX entry")
+    if tokens[0] != "01":
+        return
+    if state.current_track.start_frames is not None:
+        raise ValueError(f"Line {line_num}: duplicate INDEX 01")
+    state.current_track.start_frames = parse_timecode(tokens[1], line_num)
 
-    for line_num, raw_line in enumerate(read_cue_text(cue_path).splitlines(), start=1):
+
+def _noop(rest: str, line_num: int, state: _ParseState) -> None:
+    # Other CUE keywords (CATALOG, FLAGS, ISRC, ...) are not needed for splitting.
+    return
+
+
+CUE_HANDLERS = {
+    "FILE": _handle_file,
+    "TRACK": _handle_track,
+    "TITLE": _handle_title,
+    "PERFORMER": _handle_performer,
+    "INDEX": _handle_index,
+}
+
+
+def _iter_cue_lines(text: str) -> Iterator[tuple[str, str, int]]:
+    """Yield (KEYWORD, rest, line number) for each meaningful CUE line."""
+    for line_num, raw_line in enumerate(text.splitlines(), start=1):
         line = raw_line.strip()
         if not line or line.startswith("REM"):
             continue
-
-        if line.upper().startswith("FILE "):
-            # Each FILE starts a new input and resets the current track context.
-            file_name = parse_file_line(raw_line, line_num)
-            file_path = cue_path.parent / file_name
-            if not file_path.exists():
-                raise FileNotFoundError(f"Line {line_num}: missing file '{file_path}'")
-            current_file = FileEntry(path=file_path)
-            file_entries.append(current_file)
-            current_track = None
-            continue
-
-        if line.upper().startswith("TRACK "):
-            # Track definitions belong to the most recent FILE entry.
-            if current_file is None:
-                raise ValueError(f"Line {line_num}: TRACK before FILE")
-            tokens = split_cue_line(line, line_num)
-            if len(tokens) < 2:
-                raise ValueError(f"Line {line_num}: malformed TRACK entry")
-            try:
-                track_number = int(tokens[1])
-            except ValueError as exc:
-                raise ValueError(f"Line {line_num}: invalid TRACK number") from exc
-            current_track = Track(number=track_number)
-            current_file.tracks.append(current_track)
+        keyword, _, rest = line.partition(" ")
+        if not rest:
+            # A keyword with nothing after it is ignored, as it always has been.
             continue
+        # Keywords are case-insensitive but almost always uppercase already;
+        # isupper() checks without allocating a new string.
+        if not keyword.isupper():
+            keyword = keyword.upper()
+        yield keyword, rest, line_num
 
-        if line.upper().startswith("TITLE "):
-            # Only track-level TITLE entries are needed for output naming.
-            tokens = split_cue_line(line, line_num)
-            if len(tokens) < 2:
-                raise ValueError(f"Line {line_num}: malformed TITLE entry")
-            title = parse_cue_value(line[len(tokens[0]):], line_num, "TITLE")
-            if current_track is None:
-                if album_title is None:
-                    album_title = title
-            else:
-                current_track.title = title
-            continue
 
-        if line.upper().startswith("PERFORMER "):
-            tokens = split_cue_line(line, line_num)
-            if len(tokens) < 2:
-                raise ValueError(f"Line {line_num}: malformed PERFORMER entry")
-            performer = parse_cue_value(line[len(tokens[0]):], line_num, "PERFORMER")
-            if current_track is None:
-                if album_performer is None:
-                    album_performer = performer
-            else:
-                current_track.performer = performer
-            continue
+def parse_cue(cue_path: Path) -> CueSheet:
+    """Parse the CUE into ordered file/track entries with INDEX 01 boundaries."""
+    # Parse the CUE, grouping tracks under their referenced FILE entries.
+    state = _ParseState(base_dir=cue_path.parent)
 
-        if line.upper().startswith("INDEX "):
-            # Only INDEX 01 defines track boundaries.
-            if current_track is None:
-                raise ValueError(f"Line {line_num}: INDEX before TRACK")
-            tokens = split_cue_line(line, line_num)
-            if len(tokens) < 3:
-                raise ValueError(f"Line {line_num}: malformed INDEX entry")
-            if tokens[1] != "01":
-                continue
-            if current_track.start is not None:
-                raise ValueError(f"Line {line_num}: duplicate INDEX 01")
-            current_track.start = parse_timecode(tokens[2], line_num)
-            continue
+    for keyword, rest, line_num in _iter_cue_lines(read_cue_text(cue_path)):
+        CUE_HANDLERS.get(keyword, _noop)(rest, line_num, state)
 
+    file_entries = state.entries
     if not file_entries:
         # The CUE must define at least one FILE entry.
         raise ValueError("No FILE entries found in CUE sheet")
@@ -237,72 +315,213 @@ def parse_cue(cue_path: Path) -> CueSheet:
         for track in entry.tracks:
             if track.title is None:
                 raise ValueError(f"Missing TITLE for track {track.number}")
-            if track.start is None:
+            if track.start_frames is None:
                 raise ValueError(f"Missing INDEX 01 for track {track.number}")
 
     return CueSheet(
         entries=file_entries,
-        album_title=album_title,
-        album_performer=album_performer,
+        album_title=state.album_title,
+        album_performer=state.album_performer,
+    )
+
+
+def _read_streaminfo_header(handle: BinaryIO, path: Path) -> bytes:
+    header = handle.read(STREAMINFO_OFFSET + STREAMINFO_LENGTH)
+    if (
+        len(header) < STREAMINFO_OFFSET + STREAMINFO_LENGTH
+        or header[:4] != b"fLaC"
+        or header[4] & 0x7F != 0
+        or int.from_bytes(header[5:8], "big") != STREAMINFO_LENGTH
+    ):
+        raise RuntimeError(f"Missing FLAC STREAMINFO block: '{path}'")
+    return header
+
+
+def read_streaminfo(path: Path) -> StreamInfo:
+    """Read the STREAMINFO block of a FLAC file."""
+    with path.open("rb") as handle:
+        header = _read_streaminfo_header(handle, path)
+    # 20 bits sample rate, 3 bits channels-1, 5 bits bps-1, 36 bits total samples.
+    packed = int.from_bytes(header[18:26], "big")
+    return StreamInfo(
+        sample_rate=packed >> 44,
+        channels=((packed >> 41) & 0x7) + 1,
+        bits_per_sample=((packed >> 36) & 0x1F) + 1,
+        total_samples=packed & TOTAL_SAMPLES_MASK,
+        md5=header[26:42],
     )
 
 
+def patch_streaminfo(path: Path, total_samples: int, md5: bytes) -> None:
+    """Rewrite the total sample count and MD5 of a FLAC STREAMINFO block in place."""
+    if not 0 <= total_samples <= TOTAL_SAMPLES_MASK or len(md5) != 16:
+        raise ValueError("Invalid STREAMINFO total samples or MD5")
+    with path.open("r+b") as handle:
+        header = _read_streaminfo_header(handle, path)
+        packed = int.from_bytes(header[18:26], "big")
+        packed = (packed & ~TOTAL_SAMPLES_MASK) | total_samples
+        handle.seek(18)
+        handle.write(packed.to_bytes(8, "big") + md5)
+
+
+def can_fix_streaminfo(path: Path) -> bool:
+    """Return whether stream-copied tracks of a FLAC can get a recomputed STREAMINFO."""
+    # Sources that do not open with a bare STREAMINFO block (e.g. ID3v2-prefixed)
+    # or whose sample size is not byte-aligned are re-encoded instead.
+    try:
+        info = read_streaminfo(path)
+    except RuntimeError:
+        return False
+    return info.bits_per_sample in FLAC_PCM_FORMATS
+
+
+def fix_flac_streaminfo(ffmpeg_path: str, path: Path) -> None:
+    """Recount samples and MD5 of a stream-copied FLAC and patch its STREAMINFO."""
+    # Stream copy keeps the source STREAMINFO; decode once (no re-encode) to
+    # hash the raw samples the way libFLAC does and count them.
+    try:
+        info = read_streaminfo(path)
+        pcm_format = FLAC_PCM_FORMATS[info.bits_per_sample]
+        cmd = [
+            ffmpeg_path,
+            *FFMPEG_BASE,
+            # Up to --jobs fixups decode at once, so keep each decoder to one thread.
+            "-threads",
+            "1",
+            "-i",
+            os.fspath(path),
+            "-map",
+            "0:a:0",
+            "-c:a",
+            f"pcm_{pcm_format}",
+            "-f",
+            pcm_format,
+            "-",
+        ]
+        digest = hashlib.md5()
+        size = 0
+        with subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, close_fds=CLOSE_FDS
+        ) as process:
+            assert process.stdout is not None
+            for chunk in iter(lambda: process.stdout.read(1 << 20), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+        frame_size = info.channels * info.bits_per_sample // 8
+        patch_streaminfo(path, size // frame_size, digest.digest())
+    except BaseException:
+        # An unpatched stream copy looks finished but carries the source's
+        # STREAMINFO, so do not leave it behind.
+        path.unlink(missing_ok=True)
+        raise
+
+
 def run_ffmpeg(
+    ffmpeg_path: str,
     input_path: Path,
-    output_path: Path,
-    start: Fraction,
-    end: Optional[Fraction],
-    metadata: dict[str, str],
-    fix_streaminfo: bool,
+    segments: List[Segment],
+    reencode: bool,
 ) -> None:
-    """Invoke ffmpeg to split a segment, optionally re-encoding FLAC for STREAMINFO."""
-    # Use stream copy for FLAC inputs unless STREAMINFO fixes are enabled.
-    if output_path.exists():
-        raise FileExistsError(f"Output file already exists: '{output_path}'")
+    """Invoke ffmpeg once to split all segments of one input into track files."""
+    # Use stream copy for FLAC inputs unless re-encoding is requested.
+    for segment in segments:
+        if segment.output_path.exists():
+            raise FileExistsError(f"Output file already exists: '{segment.output_path}'")
 
     suffix = input_path.suffix.lower()
     if suffix in (".wav", ".wave"):
         codec_args = ["-c:a", "flac", "-compression_level", "8"]
     elif suffix == ".flac":
-        if fix_streaminfo:
+        if reencode:
             codec_args = ["-c:a", "flac", "-compression_level", "8"]
         else:
             codec_args = ["-c", "copy"]
     else:
         raise RuntimeError(f"Unsupported input format: '{input_path.suffix}'")
 
-    cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-i",
-        str(input_path),
-        "-ss",
-        fraction_to_timestamp(start),
-    ]
+    # Every track is written by this one process; each output block below
+    # carries its own cut points, codec and tags.
+    cmd = [ffmpeg_path, *FFMPEG_BASE]
+    output_args: List[List[str]] = []
 
-    if end is not None:
-        cmd.extend(["-to", fraction_to_timestamp(end)])
-
-    cmd.extend(codec_args)
-
-    for key, value in metadata.items():
-        cmd.extend(["-metadata", f"{key}={value}"])
-
-    cmd.append(str(output_path))
-
-    subprocess.run(cmd, check=True)
+    if suffix in (".wav", ".wave"):
+        # PCM seeks are exact, so each track gets its own input seeked with -ss
+        # before -i: every sample is read once and nothing is decoded to be dropped.
+        for index, segment in enumerate(segments):
+            cmd.extend(["-ss", frames_to_timestamp(segment.start_frames)])
+            if segment.end_frames is not None:
+                duration = segment.end_frames - segment.start_frames
+                cmd.extend(["-t", frames_to_timestamp(duration)])
+            cmd.extend(["-i", os.fspath(input_path)])
+            output_args.append(["-map", f"{index}:a:0"])
+    elif codec_args == ["-c", "copy"]:
+        # Stream copy does not decode, so each output simply cuts by timestamp.
+        cmd.extend(["-i", os.fspath(input_path)])
+        for segment in segments:
+            args = ["-ss", frames_to_timestamp(segment.start_frames)]
+            if segment.end_frames is not None:
+                args.extend(["-to", frames_to_timestamp(segment.end_frames)])
+            output_args.append(args)
+    else:
+        # FLAC frames are not sample-addressable, so decode the input once and
+        # fan it out to one trimmed output per track. -threads before -i limits
+        # the decoder; the output-side -threads below limits each encoder.
+        cmd.extend(["-threads", "1", "-i", os.fspath(input_path)])
+        count = len(segments)
+        if count > 1:
+            sources = [f"[s{index}]" for index in range(count)]
+            graph = [f"[0:a:0]asplit={count}{''.join(sources)}"]
+        else:
+            sources = ["[0:a:0]"]
+            graph = []
+        for source, (index, segment) in zip(sources, enumerate(segments)):
+            trim = f"atrim=start={frames_to_timestamp(segment.start_frames)}"
+            if segment.end_frames is not None:
+                trim += f":end={frames_to_timestamp(segment.end_frames)}"
+            graph.append(f"{source}{trim},asetpts=PTS-STARTPTS[o{index}]")
+            # Carry embedded cover art along with each track, as ffmpeg does by default.
+            output_args.append(["-map", f"[o{index}]", "-map", "0:v?", "-c:v", "copy"])
+        cmd.extend(["-filter_complex", ";".join(graph)])
+
+    for args, segment in zip(output_args, segments):
+        cmd.extend(args)
+        cmd.extend(codec_args)
+        # Parallelism comes from the --jobs pool, so keep each encoder to one thread.
+        cmd.extend(["-threads", "1"])
+        for key, value in segment.metadata.items():
+            cmd.extend(["-metadata", f"{key}={value}"])
+        cmd.append(os.fspath(segment.output_path))
+
+    # An explicit executable path and CLOSE_FDS allow posix_spawn on POSIX.
+    subprocess.run(cmd, stdin=subprocess.DEVNULL, close_fds=CLOSE_FDS, check=True)
+
+
+def split_entry(
+    ffmpeg_path: str,
+    input_path: Path,
+    segments: List[Segment],
+    reencode: bool,
+) -> None:
+    """Split one group of tracks from an input, reporting when the job starts."""
+    print(f"{STYLE.info} Splitting {len(segments)} track(s) from {input_path.name}...")
+    run_ffmpeg(ffmpeg_path, input_path, segments, reencode)
 
 
 def split_files(
     cue_path: Path,
     tag_output: bool,
     fix_streaminfo: bool,
+    reencode: bool,
+    jobs: int,
 ) -> tuple[int, set[str]]:
     """Split all FILE entries referenced by the CUE into track files."""
-    # Iterate in CUE order and split each file at INDEX 01 boundaries.
-    if shutil.which("ffmpeg") is None:
+    # Build jobs per FILE entry in CUE order, then run them in parallel.
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
         raise RuntimeError("ffmpeg not found in PATH")
 
     cue = parse_cue(cue_path)
@@ -316,11 +535,13 @@ def split_files(
     monotonic = all(a < b for a, b in zip(track_numbers, track_numbers[1:]))
 
     tags_used: set[str] = set()
+    tasks: List[tuple[Path, List[Segment], bool, bool]] = []
 
     for file_index, entry in enumerate(cue.entries, start=1):
+        segments: List[Segment] = []
         for index, track in enumerate(entry.tracks):
             next_track = entry.tracks[index + 1] if index + 1 < len(entry.tracks) else None
-            end_time = next_track.start if next_track is not None else None
+            end_frames = next_track.start_frames if next_track is not None else None
             if monotonic:
                 track_label = f"{track.number:02d}"
             else:
@@ -328,7 +549,6 @@ def split_files(
             safe_title = sanitize_filename(track.title or "")
             output_name = f"{track_label} - {safe_title}.flac"
             output_path = output_dir / output_name
-            print(f"{STYLE.info} Task {written + 1} of {total_tracks}: {output_name}")
             metadata: dict[str, str] = {}
             if tag_output:
                 metadata["TRACKNUMBER"] = str(track.number)
@@ -340,26 +560,90 @@ def split_files(
                     metadata["ARTIST"] = performer
                     metadata["ALBUMARTIST"] = performer
                 tags_used.update(metadata.keys())
-            run_ffmpeg(
-                entry.path,
-                output_path,
-                track.start,
-                end_time,
-                metadata,
-                fix_streaminfo=fix_streaminfo,
+            segments.append(Segment(output_path, track.start_frames, end_frames, metadata))
+        entry_reencode = reencode
+        if entry.path.suffix.lower() == ".flac" and not reencode and fix_streaminfo:
+            entry_reencode = not can_fix_streaminfo(entry.path)
+        needs_fix = (
+            entry.path.suffix.lower() == ".flac" and not entry_reencode and fix_streaminfo
+        )
+        group_size = len(segments)
+        if entry_reencode or entry.path.suffix.lower() in (".wav", ".wave"):
+            # One ffmpeg process encodes its outputs one after another (before
+            # ffmpeg 7), so spread the file over up to `jobs` contiguous groups.
+            group_size = -(-len(segments) // jobs)
+        for start in range(0, len(segments), group_size):
+            group = segments[start:start + group_size]
+            tasks.append((entry.path, group, entry_reencode, needs_fix))
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Each future maps to the tracks it finishes. Stream-copied FLAC tracks
+        # are finished by a STREAMINFO fixup job per track, queued on the same
+        # pool once their split is done so the decodes also run in parallel.
+        pending: dict[Future[None], tuple[List[Segment], bool]] = {
+            executor.submit(split_entry, ffmpeg_path, path, group, entry_reencode): (
+                group,
+                needs_fix,
             )
-            written += 1
+            for path, group, entry_reencode, needs_fix in tasks
+        }
+        splits = set(pending)
+        failure: Optional[BaseException] = None
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    segments, needs_fix = pending.pop(future)
+                    if future.cancelled():
+                        continue
+                    exc = future.exception()
+                    if exc is not None:
+                        if failure is None:
+                            # Stop queued splits, but let running splits and the
+                            # fixups of finished splits complete, so no finished
+                            # track is left with the source's STREAMINFO.
+                            failure = exc
+                            for queued in splits.intersection(pending):
+                                queued.cancel()
+                        continue
+                    if needs_fix:
+                        for segment in segments:
+                            fixup = executor.submit(
+                                fix_flac_streaminfo, ffmpeg_path, segment.output_path
+                            )
+                            pending[fixup] = ([segment], False)
+                        continue
+                    for segment in segments:
+                        written += 1
+                        print(
+                            f"{STYLE.info} Task {written} of {total_tracks}: "
+                            f"{segment.output_path.name}"
+                        )
+        except BaseException:
+            # Interrupted: stop queued jobs; jobs already running finish. A track
+            # whose fixup never ran still has the source's STREAMINFO, so drop it.
+            for future, (segments, _) in pending.items():
+                if future.cancel() and future not in splits:
+                    for segment in segments:
+                        segment.output_path.unlink(missing_ok=True)
+            raise
+        if failure is not None:
+            raise failure
 
     return written, tags_used
 
 def main() -> int:
     """CLI entrypoint."""
+    # argparse, like the splitting-only imports, stays out of library imports.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Split FLAC files using a CUE sheet. "
-            "By default, FLAC outputs are re-encoded to fix STREAMINFO; "
-            "use --streamcopy to keep original FLAC frames (STREAMINFO may be wrong). "
-            "WAV inputs are re-encoded to FLAC."
+            "By default, FLAC tracks keep the original FLAC frames and get a "
+            "corrected STREAMINFO (sample count and MD5); "
+            "use --reencode for sample-accurate cuts, or --streamcopy to skip "
+            "the STREAMINFO fix. WAV inputs are re-encoded to FLAC."
         ),
         epilog=(
             "Output files are written next to the CUE as:\n"
@@ -374,12 +658,29 @@ def main() -> int:
         action="store_true",
         help="Disable writing tags derived from the CUE sheet",
     )
-    parser.add_argument(
+    flac_mode = parser.add_mutually_exclusive_group()
+    flac_mode.add_argument(
         "--streamcopy",
         action="store_true",
-        help="Keep original FLAC frames (STREAMINFO may be wrong)",
+        help="Keep original FLAC frames without fixing STREAMINFO (may be wrong)",
+    )
+    flac_mode.add_argument(
+        "--reencode",
+        action="store_true",
+        help="Re-encode FLAC tracks (level 8) so cuts are sample-accurate",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Maximum number of ffmpeg processes to run at once: track groups "
+            "within a file and per-track STREAMINFO fixups (default: CPU count)"
+        ),
     )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     print()
     print(BANNER)
@@ -397,6 +698,8 @@ def main() -> int:
             cue_path,
             tag_output=not args.notagging,
             fix_streaminfo=not args.streamcopy,
+            reencode=args.reencode,
+            jobs=args.jobs,
         )
     except subprocess.CalledProcessError as exc:
         print(
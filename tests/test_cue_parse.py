@@ -3,7 +3,7 @@ import tempfile
 from pathlib import Path
 import unittest
 
-from splatflac import parse_cue
+from splatflac import frames_to_timestamp, parse_cue, parse_file_line, sanitize_filename
 
 
 class CueParseTests(unittest.TestCase):
@@ -31,6 +31,101 @@ class CueParseTests(unittest.TestCase):
 
         self.assertEqual(cue.entries[0].tracks[0].title, "It's a test")
         self.assertEqual(cue.entries[0].tracks[1].title, 'He said "Hello" today')
+        self.assertEqual(cue.entries[0].tracks[0].start_frames, 0)
+        self.assertEqual(cue.entries[0].tracks[1].start_frames, 75)
+
+    def test_encodings(self) -> None:
+        cue_text = 'TITLE "Caf\u00e9"\r\nFILE "audio.flac" WAVE\r\n  TRACK 01 AUDIO\r\n'
+        cue_text += '    TITLE "Na\u00efve"\r\n    INDEX 01 00:00:00\r\n'
+        encoded = {
+            "utf-8-bom": b"\xef\xbb\xbf" + cue_text.encode("utf-8"),
+            "utf-16": cue_text.encode("utf-16"),
+            "utf-8": cue_text.encode("utf-8"),
+            "cp1252": cue_text.encode("cp1252"),
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / "audio.flac").write_bytes(b"")
+            for name, data in encoded.items():
+                with self.subTest(encoding=name):
+                    cue_path = tmp_path / f"{name}.cue"
+                    cue_path.write_bytes(data)
+
+                    cue = parse_cue(cue_path)
+
+                    self.assertEqual(cue.album_title, "Caf\u00e9")
+                    self.assertEqual(cue.entries[0].tracks[0].title, "Na\u00efve")
+
+    def test_keywords_are_case_insensitive(self) -> None:
+        cue_text = textwrap.dedent(
+            '''
+            title "Album"
+            File "audio.flac" WAVE
+              track 01 AUDIO
+                Title "One"
+                Performer "Someone"
+                index 01 00:00:12
+            '''
+        ).lstrip()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / "audio.flac").write_bytes(b"")
+            cue_path = tmp_path / "test.cue"
+            cue_path.write_text(cue_text, encoding="utf-8")
+
+            cue = parse_cue(cue_path)
+
+        track = cue.entries[0].tracks[0]
+        self.assertEqual(cue.album_title, "Album")
+        self.assertEqual((track.title, track.performer), ("One", "Someone"))
+        self.assertEqual(track.start_frames, 12)
+
+    def test_bare_keywords_are_ignored(self) -> None:
+        cue_text = textwrap.dedent(
+            '''
+            FILE "audio.flac" WAVE
+              TRACK 01 AUDIO
+                TITLE
+                PERFORMER
+                TITLE "One"
+                INDEX 01 00:00:00
+              TRACK
+            '''
+        ).lstrip()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / "audio.flac").write_bytes(b"")
+            cue_path = tmp_path / "test.cue"
+            cue_path.write_text(cue_text, encoding="utf-8")
+
+            cue = parse_cue(cue_path)
+
+        self.assertEqual(len(cue.entries[0].tracks), 1)
+        self.assertEqual(cue.entries[0].tracks[0].title, "One")
+        self.assertIsNone(cue.entries[0].tracks[0].performer)
+
+    def test_parse_file_line(self) -> None:
+        self.assertEqual(parse_file_line(' "Side A.flac" WAVE', 1), "Side A.flac")
+        self.assertEqual(parse_file_line(' "C:\\rips\\a.flac" WAVE', 1), "C:\\rips\\a.flac")
+        self.assertEqual(parse_file_line(" side_b.wav\tWAVE", 1), "side_b.wav")
+        for rest in (' "Side A.flac"', ' "" WAVE', ' "Side A.flac WAVE', " side_b.wav"):
+            with self.subTest(rest=rest):
+                with self.assertRaises(ValueError):
+                    parse_file_line(rest, 1)
+
+    def test_frames_to_timestamp(self) -> None:
+        self.assertEqual(frames_to_timestamp(0), "0.000000")
+        self.assertEqual(frames_to_timestamp(1), "0.013333")
+        self.assertEqual(frames_to_timestamp(2), "0.026667")
+        self.assertEqual(frames_to_timestamp(61 * 75 + 74), "61.986667")
+
+    def test_sanitize_filename(self) -> None:
+        self.assertEqual(sanitize_filename('a<b>c:d"e/f\\g|h?i*j'), "a_b_c_d_e_f_g_h_i_j")
+        self.assertEqual(sanitize_filename(" ../x "), "___x")
+        self.assertEqual(sanitize_filename("  "), "untitled")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+import contextlib
+import hashlib
+import io
+import subprocess
+import tempfile
+import textwrap
+from pathlib import Path
+import unittest
+from unittest import mock
+
+import splatflac
+from splatflac import read_streaminfo, split_files
+from test_streaminfo import build_flac_header
+
+SOURCE_SAMPLES = 999999
+SOURCE_MD5 = hashlib.md5(b"source").digest()
+# 100 samples of 16-bit stereo PCM, as decoded by a STREAMINFO fixup.
+TRACK_PCM = bytes(400)
+FFMPEG = ["/bin/ffmpeg", "-hide_banner", "-nostdin", "-loglevel", "error"]
+THREE_TRACKS = """
+    FILE "a.flac" WAVE
+      TRACK 01 AUDIO
+        TITLE "One"
+        INDEX 01 00:00:00
+      TRACK 02 AUDIO
+        TITLE "Two"
+        INDEX 01 00:01:00
+      TRACK 03 AUDIO
+        TITLE "Three"
+        INDEX 01 00:02:00
+"""
+TRACK_NAMES = ["01 - One.flac", "02 - Two.flac", "03 - Three.flac"]
+
+
+class FakeFfmpeg:
+    """Stand-in for subprocess.run/Popen that records ffmpeg argv."""
+
+    def __init__(self, failing_input: str = "", decode_returncode: int = 0) -> None:
+        self.runs: list[list[str]] = []
+        self.decodes: list[list[str]] = []
+        self.failing_input = failing_input
+        self.decode_returncode = decode_returncode
+
+    def run(self, cmd, **kwargs):
+        self.runs.append(list(cmd))
+        inputs = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-i"]
+        if self.failing_input and any(x.endswith(self.failing_input) for x in inputs):
+            raise subprocess.CalledProcessError(1, cmd)
+        # Every output is the last argument of its block and ends in .flac.
+        for index, arg in enumerate(cmd):
+            if arg.endswith(".flac") and cmd[index - 1] != "-i":
+                Path(arg).write_bytes(
+                    build_flac_header(SOURCE_SAMPLES, SOURCE_MD5) + b"\xff\xf8" + bytes(64)
+                )
+        return subprocess.CompletedProcess(cmd, 0)
+
+    def popen(self, cmd, **kwargs):
+        self.decodes.append(list(cmd))
+        process = mock.MagicMock()
+        process.__enter__.return_value = process
+        process.stdout = io.BytesIO(TRACK_PCM)
+        process.returncode = self.decode_returncode
+        return process
+
+
+class SplitFilesTests(unittest.TestCase):
+    def split(self, cue_text: str, files: dict[str, bytes], fake: FakeFfmpeg, **kwargs):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        tmp_path = Path(tmp_dir.name)
+        for name, data in files.items():
+            (tmp_path / name).write_bytes(data)
+        cue_path = tmp_path / "album.cue"
+        cue_path.write_text(textwrap.dedent(cue_text).lstrip(), encoding="utf-8")
+        options = {"tag_output": True, "fix_streaminfo": True, "reencode": False, "jobs": 1}
+        options.update(kwargs)
+
+        output = io.StringIO()
+        with (
+            mock.patch.object(splatflac.shutil, "which", return_value="/bin/ffmpeg"),
+            mock.patch.object(splatflac.subprocess, "run", side_effect=fake.run),
+            mock.patch.object(splatflac.subprocess, "Popen", side_effect=fake.popen),
+            contextlib.redirect_stdout(output),
+        ):
+            try:
+                result = split_files(cue_path, **options)
+            except subprocess.CalledProcessError as exc:
+                result = exc
+        return tmp_path, result, output.getvalue()
+
+    def test_flac_stream_copy_argv(self) -> None:
+        fake = FakeFfmpeg()
+
+        tmp_path, result, output = self.split(
+            THREE_TRACKS,
+            {"a.flac": build_flac_header(SOURCE_SAMPLES, SOURCE_MD5)},
+            fake,
+            jobs=4,
+        )
+
+        # Stream copy writes every track from one process, however many jobs.
+        out = [str(tmp_path / name) for name in TRACK_NAMES]
+        self.assertEqual(
+            fake.runs,
+            [
+                [*FFMPEG, "-i", str(tmp_path / "a.flac"),
+                 "-ss", "0.000000", "-to", "1.000000", "-c", "copy", "-threads", "1",
+                 "-metadata", "TRACKNUMBER=1", "-metadata", "TITLE=One", out[0],
+                 "-ss", "1.000000", "-to", "2.000000", "-c", "copy", "-threads", "1",
+                 "-metadata", "TRACKNUMBER=2", "-metadata", "TITLE=Two", out[1],
+                 "-ss", "2.000000", "-c", "copy", "-threads", "1",
+                 "-metadata", "TRACKNUMBER=3", "-metadata", "TITLE=Three", out[2]],
+            ],
+        )
+        self.assertCountEqual(
+            fake.decodes,
+            [
+                [*FFMPEG, "-threads", "1", "-i", path, "-map", "0:a:0",
+                 "-c:a", "pcm_s16le", "-f", "s16le", "-"]
+                for path in out
+            ],
+        )
+        self.assertEqual(result, (3, {"TRACKNUMBER", "TITLE"}))
+        self.assertEqual(output.count(" Task "), 3)
+        self.assertIn("Task 3 of 3", output)
+
+    def test_reencode_argv_and_groups(self) -> None:
+        fake = FakeFfmpeg()
+
+        tmp_path, result, output = self.split(
+            THREE_TRACKS,
+            {"a.flac": build_flac_header(SOURCE_SAMPLES, SOURCE_MD5)},
+            fake,
+            tag_output=False,
+            reencode=True,
+            jobs=2,
+        )
+
+        # Three tracks over two jobs: one process for tracks 1-2, one for 3.
+        source = str(tmp_path / "a.flac")
+        out = [str(tmp_path / name) for name in TRACK_NAMES]
+        encode = ["-c:a", "flac", "-compression_level", "8", "-threads", "1"]
+        cover = ["-map", "0:v?", "-c:v", "copy"]
+        self.assertCountEqual(
+            fake.runs,
+            [
+                [*FFMPEG, "-threads", "1", "-i", source, "-filter_complex",
+                 "[0:a:0]asplit=2[s0][s1];"
+                 "[s0]atrim=start=0.000000:end=1.000000,asetpts=PTS-STARTPTS[o0];"
+                 "[s1]atrim=start=1.000000:end=2.000000,asetpts=PTS-STARTPTS[o1]",
+                 "-map", "[o0]", *cover, *encode, out[0],
+                 "-map", "[o1]", *cover, *encode, out[1]],
+                [*FFMPEG, "-threads", "1", "-i", source, "-filter_complex",
+                 "[0:a:0]atrim=start=2.000000,asetpts=PTS-STARTPTS[o0]",
+                 "-map", "[o0]", *cover, *encode, out[2]],
+            ],
+        )
+        self.assertEqual(fake.decodes, [])
+        self.assertEqual(result, (3, set()))
+        self.assertEqual(output.count(" Task "), 3)
+
+    def test_wav_argv(self) -> None:
+        fake = FakeFfmpeg()
+        cue_text = THREE_TRACKS.replace('"a.flac"', '"b.wav"')
+
+        tmp_path, result, output = self.split(
+            cue_text, {"b.wav": b"RIFF"}, fake, tag_output=False, jobs=1
+        )
+
+        # Each WAV track is its own input, seeked before -i and mapped by index.
+        source = str(tmp_path / "b.wav")
+        out = [str(tmp_path / name) for name in TRACK_NAMES]
+        encode = ["-c:a", "flac", "-compression_level", "8", "-threads", "1"]
+        self.assertEqual(
+            fake.runs,
+            [
+                [*FFMPEG,
+                 "-ss", "0.000000", "-t", "1.000000", "-i", source,
+                 "-ss", "1.000000", "-t", "1.000000", "-i", source,
+                 "-ss", "2.000000", "-i", source,
+                 "-map", "0:a:0", *encode, out[0],
+                 "-map", "1:a:0", *encode, out[1],
+                 "-map", "2:a:0", *encode, out[2]],
+            ],
+        )
+        self.assertEqual(fake.decodes, [])
+        self.assertEqual(output.count(" Task "), 3)
+
+    def test_failed_split_still_fixes_finished_tracks(self) -> None:
+        cue_text = """
+            FILE "a.flac" WAVE
+              TRACK 01 AUDIO
+                TITLE "One"
+                INDEX 01 00:00:00
+              TRACK 02 AUDIO
+                TITLE "Two"
+                INDEX 01 00:01:00
+            FILE "b.flac" WAVE
+              TRACK 01 AUDIO
+                TITLE "Three"
+                INDEX 01 00:00:00
+        """
+        source = build_flac_header(SOURCE_SAMPLES, SOURCE_MD5)
+        fake = FakeFfmpeg(failing_input="b.flac")
+
+        tmp_path, result, output = self.split(
+            cue_text, {"a.flac": source, "b.flac": source}, fake
+        )
+
+        self.assertIsInstance(result, subprocess.CalledProcessError)
+        for name in ("01-01 - One.flac", "01-02 - Two.flac"):
+            info = read_streaminfo(tmp_path / name)
+            self.assertEqual(info.total_samples, 100)
+            self.assertEqual(info.md5, hashlib.md5(TRACK_PCM).digest())
+        self.assertEqual(output.count(" Task "), 2)
+
+    def test_failed_fixup_removes_unfixed_track(self) -> None:
+        cue_text = """
+            FILE "a.flac" WAVE
+              TRACK 01 AUDIO
+                TITLE "One"
+                INDEX 01 00:00:00
+        """
+        fake = FakeFfmpeg(decode_returncode=1)
+
+        tmp_path, result, output = self.split(
+            cue_text, {"a.flac": build_flac_header(SOURCE_SAMPLES, SOURCE_MD5)}, fake
+        )
+
+        self.assertIsInstance(result, subprocess.CalledProcessError)
+        self.assertFalse((tmp_path / "01 - One.flac").exists())
+        self.assertNotIn(" Task ", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
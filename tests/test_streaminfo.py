@@ -0,0 +1,82 @@
+import hashlib
+import tempfile
+from pathlib import Path
+import unittest
+
+from splatflac import can_fix_streaminfo, patch_streaminfo, read_streaminfo
+
+
+def build_flac_header(total_samples: int, md5: bytes, bits_per_sample: int = 16) -> bytes:
+    # 44.1 kHz, 2 channels, packed as in the FLAC spec.
+    packed = (44100 << 44) | ((2 - 1) << 41) | ((bits_per_sample - 1) << 36) | total_samples
+    streaminfo = (
+        (4096).to_bytes(2, "big")
+        + (4096).to_bytes(2, "big")
+        + (14).to_bytes(3, "big")
+        + (9000).to_bytes(3, "big")
+        + packed.to_bytes(8, "big")
+        + md5
+    )
+    return b"fLaC" + bytes([0x80]) + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+
+class StreamInfoTests(unittest.TestCase):
+    def test_patch_streaminfo(self) -> None:
+        old_md5 = hashlib.md5(b"source").digest()
+        new_md5 = hashlib.md5(b"track").digest()
+        frames = b"\xff\xf8" + bytes(64)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            flac_path = Path(tmp_dir) / "track.flac"
+            flac_path.write_bytes(build_flac_header(882000, old_md5) + frames)
+
+            info = read_streaminfo(flac_path)
+            self.assertEqual(info.sample_rate, 44100)
+            self.assertEqual(info.channels, 2)
+            self.assertEqual(info.bits_per_sample, 16)
+            self.assertEqual(info.total_samples, 882000)
+            self.assertEqual(info.md5, old_md5)
+
+            patch_streaminfo(flac_path, 317952, new_md5)
+
+            info = read_streaminfo(flac_path)
+            data = flac_path.read_bytes()
+
+        self.assertEqual(info.sample_rate, 44100)
+        self.assertEqual(info.channels, 2)
+        self.assertEqual(info.bits_per_sample, 16)
+        self.assertEqual(info.total_samples, 317952)
+        self.assertEqual(info.md5, new_md5)
+        self.assertEqual(data, build_flac_header(317952, new_md5) + frames)
+
+    def test_rejects_non_flac(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bad_path = Path(tmp_dir) / "audio.flac"
+            bad_path.write_bytes(b"RIFF" + bytes(60))
+
+            with self.assertRaises(RuntimeError):
+                read_streaminfo(bad_path)
+            with self.assertRaises(RuntimeError):
+                patch_streaminfo(bad_path, 0, bytes(16))
+
+    def test_can_fix_streaminfo(self) -> None:
+        md5 = hashlib.md5(b"source").digest()
+        id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)
+        sources = {
+            "16-bit.flac": (build_flac_header(882000, md5), True),
+            "24-bit.flac": (build_flac_header(882000, md5, bits_per_sample=24), True),
+            "20-bit.flac": (build_flac_header(882000, md5, bits_per_sample=20), False),
+            "id3v2.flac": (id3v2 + build_flac_header(882000, md5), False),
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name, (data, expected) in sources.items():
+                with self.subTest(source=name):
+                    flac_path = Path(tmp_dir) / name
+                    flac_path.write_bytes(data + b"\xff\xf8" + bytes(64))
+
+                    self.assertIs(can_fix_streaminfo(flac_path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()